@@ -2,3 +2,5 @@ from .tdmagsus import read_cur_file
 from .tdmagsus import Furnace
 from .tdmagsus import MeasurementCycle
 from .tdmagsus import MeasurementSet
+from .tdmagsus import Sweep
+from .tdmagsus import Cycle
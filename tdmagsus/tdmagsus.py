@@ -28,52 +28,104 @@ susceptibility of the sample itself.
 import glob
 import os.path
 import re
-from typing import List, Optional, Tuple, Callable
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Callable, Iterator
 
 import numpy
-from numpy import array, ndarray
+from numpy import ndarray
 from scipy.interpolate import UnivariateSpline
 
-line_pattern = re.compile(r"^ +\d")
-field_separator = re.compile(" +")
 
+@dataclass(eq=False)
+class Sweep:
+    """Measurements from a single heating or cooling run.
 
-def read_cur_file(filename: str) ->\
-        Tuple[Tuple[ndarray, ndarray], Tuple[ndarray, ndarray]]:
+    The temperatures and susceptibilities are held in two parallel
+    ndarrays of equal length.
+    """
+
+    temps: ndarray
+    mss: ndarray
+
+    def as_tuple(self) -> Tuple[ndarray, ndarray]:
+        """Return this sweep as a (temperatures, susceptibilities) tuple.
+
+        :return: a 2-tuple of ndarrays
+        """
+        return self.temps, self.mss
+
+    def __iter__(self) -> Iterator[ndarray]:
+        """Iterate over the temperatures and susceptibilities.
+
+        This allows a sweep to be unpacked like a 2-tuple.
+        """
+        return iter(self.as_tuple())
+
+    def __getitem__(self, index: int) -> ndarray:
+        """Return the temperatures (index 0) or susceptibilities (index 1)."""
+        return self.as_tuple()[index]
+
+
+@dataclass(eq=False)
+class Cycle:
+    """Measurements from a heating run and the following cooling run."""
+
+    heat: Sweep
+    cool: Sweep
+
+    def as_tuple(self) -> Tuple[Tuple[ndarray, ndarray],
+                                Tuple[ndarray, ndarray]]:
+        """Return this cycle as nested tuples.
+
+        :return: ((heating_temps, heating_susceptibilities),
+                  (cooling_temps, cooling_susceptibilities))
+        """
+        return self.heat.as_tuple(), self.cool.as_tuple()
+
+    def __iter__(self) -> Iterator[Sweep]:
+        """Iterate over the heating and cooling sweeps.
+
+        This allows a cycle to be unpacked like a 2-tuple.
+        """
+        return iter((self.heat, self.cool))
+
+    def __getitem__(self, index: int) -> Sweep:
+        """Return the heating (index 0) or cooling (index 1) sweep."""
+        return (self.heat, self.cool)[index]
+
+
+def read_cur_file(filename: str) -> Cycle:
     """Read a .CUR magnetic susceptibility file.
 
     :param filename: name of file to read
-    :return: ((heating_temps, heating_mag_sus_values),
-       (cooling_temps, cooling_mag_sus_values))
-      This is a tuple of two tuples, each containing two ndarrays.
+    :return: a Cycle containing the heating and cooling sweeps
     """
 
-    temperatures = []
-    mag_suss = []
-    with open(filename, "r") as infile:
-        for line in infile:
-            if line_pattern.match(line.rstrip()):
-                temperature, mag_sus = \
-                    map(float, field_separator.split(line.lstrip())[0:2])
-                temperatures.append(temperature)
-                mag_suss.append(mag_sus)
+    # Data lines start with one or more spaces followed by a digit; header
+    # lines start with other characters. This is checked with plain string
+    # operations, which are much cheaper than a regular expression match.
+    with open(filename, "r", buffering=1 << 16) as infile:
+        data_lines = [line for line in infile
+                      if line[:1] == " " and line.lstrip(" ")[:1].isdigit()]
+    # Parse all the data lines in a single bulk call; only the first two
+    # columns (temperature and susceptibility) are needed.
+    temperatures, mag_suss = \
+        numpy.loadtxt(data_lines, usecols=(0, 1), ndmin=2, unpack=True)
 
     # Looking for the first temperature decrease is an unreliable way to find
     # the start of the cooling curve: it's not guaranteed that the heating
     # curve will be monotonically increasing, especially around 100°C where
     # evaporation from a moist sample can cause a brief drop in temperature.
     # Instead we split at the maximum of the entire temperature series.
-    split_at = temperatures.index(max(temperatures))
+    split_at = int(numpy.argmax(temperatures))
     # The maximum temperature is duplicated: it's the last step in the
-    # heating array, and also the first step in the cooling array.
-    heating = (temperatures[:(split_at + 1)], mag_suss[:(split_at + 1)])
-    cooling = (temperatures[split_at:], mag_suss[split_at:])
-
-    cooling[0].reverse()
-    cooling[1].reverse()
-    heating = (array(heating[0][1:]), array(heating[1][1:]))
-    cooling = (array(cooling[0][1:]), array(cooling[1][1:]))
-    return heating, cooling
+    # heating array, and also the first step in the cooling array. The first
+    # heating step and the last cooling step are discarded.
+    heating = Sweep(temperatures[1:(split_at + 1)].copy(),
+                    mag_suss[1:(split_at + 1)].copy())
+    cooling = Sweep(temperatures[split_at:-1][::-1].copy(),
+                    mag_suss[split_at:-1][::-1].copy())
+    return Cycle(heating, cooling)
 
 
 class Furnace:
@@ -96,14 +148,11 @@ class Furnace:
         :param temps_mss: tuple of temperatures and mag sus values
         :return: same values, padded by two extra data points at each end
         """
-        temps, mss = temps_mss
-        tlist = list(temps.tolist())
-        mlist = list(mss.tolist())
-        tlist = [(tlist[0] - 20)] + [(tlist[0] - 10)] + \
-            tlist + [tlist[-1] + 10] + [tlist[-1] + 20]
-        mlist = [mlist[0]] + [mlist[0]] + \
-            mlist + [mlist[-1]] + [mlist[-1]]
-        return array(tlist), array(mlist)
+        temps, mss = numpy.asarray(temps_mss[0]), numpy.asarray(temps_mss[1])
+        temps_out = numpy.concatenate(
+            ([temps[0] - 20, temps[0] - 10], temps,
+             [temps[-1] + 10, temps[-1] + 20]))
+        return temps_out, numpy.pad(mss, 2, mode="edge")
 
     def __init__(self, filename: str, smoothing: float = 100) -> None:
         """Initialize Furnace object from a CUR file.
@@ -111,9 +160,9 @@ class Furnace:
         :param filename: file path from which to read furnace data
         :param smoothing: smoothing factor for spline curve
         """
-        heat, cool = read_cur_file(filename)
-        self.heat_data = Furnace.extend_data(heat)
-        self.cool_data = Furnace.extend_data(cool)
+        data = read_cur_file(filename)
+        self.heat_data = Furnace.extend_data(data.heat.as_tuple())
+        self.cool_data = Furnace.extend_data(data.cool.as_tuple())
         self.heat_spline = UnivariateSpline(*self.heat_data, s=smoothing)
         self.cool_spline = UnivariateSpline(*self.cool_data, s=smoothing)
 
@@ -138,38 +187,35 @@ class Furnace:
 
     @staticmethod
     def correct_with_spline(temps: List[float], mss: List[float],
-                            spline: Callable[[float], float])\
+                            spline: Callable[[ndarray], ndarray])\
             -> Tuple[List[float], ndarray]:
         """Correct susceptibility measurements using a supplied spline.
 
         :param temps: an array_like of temperatures
         :param mss: an array_like of magnetic susceptibility measurement
                     taken at the specified temperatures
-        :param spline: a function mapping a temperature to a furnace
-                       susceptibility
+        :param spline: a function mapping an ndarray of temperatures to an
+                       ndarray of furnace susceptibilities (e.g. a
+                       UnivariateSpline)
         :return: a 2-tuple containing temperatures and a corresponding series of
                  corrected susceptibilities
         """
-        mss_corrected = numpy.zeros_like(mss)
-        for i in range(0, len(temps)):
-            mss_corrected[i] = mss[i] - spline(temps[i])
-        return temps, mss_corrected
+        # Evaluate the spline over all the temperatures in a single call
+        # rather than point-by-point.
+        return temps, numpy.asarray(mss) - spline(numpy.asarray(temps))
 
-    def correct(self, heating: Tuple, cooling: Tuple) -> Tuple[Tuple, Tuple]:
+    def correct(self, cycle: Cycle) -> Cycle:
         """Correct susceptibility measurements using these furnace measurements
 
-        :param heating: a 2-tuple (temperatures, susceptibilities) of
-                        array_likes for the heating measurements
-        :param cooling: a 2-tuple (temperatures, susceptibilities) of
-                        array_likes for the cooling measurements
-        :return: a 2-tuple of 2-tuples giving the corrected measurements:
-                 ((heating_temperatures, heating_susceptibilities),
-                  (cooling_temperatures, cooling_susceptibilities))
+        :param cycle: the heating and cooling measurements to correct
+        :return: a Cycle giving the corrected measurements
         """
-        return (Furnace.correct_with_spline(heating[0], heating[1],
-                                            self.heat_spline),
-                Furnace.correct_with_spline(cooling[0], cooling[1],
-                                            self.cool_spline))
+        (heat_temps, heat_mss), (cool_temps, cool_mss) = cycle
+        return Cycle(
+            Sweep(*Furnace.correct_with_spline(
+                heat_temps, heat_mss, self.heat_spline)),
+            Sweep(*Furnace.correct_with_spline(
+                cool_temps, cool_mss, self.cool_spline)))
 
 
 class MeasurementCycle:
@@ -185,15 +231,82 @@ class MeasurementCycle:
         :param nom_vol:
         """
 
-        self.furnace = furnace
         self.real_vol = real_vol
         self.nom_vol = nom_vol
-        (heating, cooling) = read_cur_file(filename)
-        if self.furnace is not None:
-            heating, cooling = self.furnace.correct(heating, cooling)
-        heating = (heating[0], self.correct_for_volume(heating[1]))
-        cooling = (cooling[0], self.correct_for_volume(cooling[1]))
-        self.data = (heating, cooling)
+        # The corrections are applied when the data are first requested.
+        self._raw_data = read_cur_file(filename)
+        self._data = None
+        self._heating_spline = None
+        self._data_modified = False
+        self.furnace = furnace
+
+    @property
+    def furnace(self) -> Optional[Furnace]:
+        """The empty furnace correction for this cycle.
+
+        Assigning to this property discards the corrected data, which
+        will be recalculated from the file contents when next requested.
+        Since that would silently undo any changes made to the data since
+        they were calculated (for instance by MeasurementSet.set_oom),
+        assignment raises a ValueError once the data have been changed.
+        """
+        return self._furnace
+
+    @furnace.setter
+    def furnace(self, furnace: Optional[Furnace]) -> None:
+        if self._data_modified:
+            raise ValueError("The furnace can't be changed after the "
+                             "corrected data have been modified.")
+        self._furnace = furnace
+        self._data = None
+        self._heating_spline = None
+
+    @property
+    def data(self) -> Cycle:
+        """The furnace- and volume-corrected data for this cycle.
+
+        The data are calculated on first access. Assigning to this
+        property discards any spline previously fitted to the data. If the
+        data arrays are modified in place, data_changed must be called
+        afterwards.
+
+        Until the data are modified, the cycle keeps the uncorrected data
+        read from the file as well as the corrected data, so that they can
+        be recalculated if the furnace is changed; it therefore uses about
+        twice as much memory as the data alone. Once the data are
+        modified, the furnace can no longer be changed and the uncorrected
+        data are released.
+        """
+        if self._data is None:
+            raw = self._raw_data
+            if self.furnace is not None:
+                data = self.furnace.correct(raw)
+            else:
+                data = Cycle(Sweep(raw.heat.temps, raw.heat.mss.copy()),
+                             Sweep(raw.cool.temps, raw.cool.mss.copy()))
+            # The arrays have just been created, so they can be scaled in
+            # place.
+            scale = self.nom_vol / self.real_vol
+            data.heat.mss *= scale
+            data.cool.mss *= scale
+            self._data = data
+        return self._data
+
+    @data.setter
+    def data(self, data: Cycle) -> None:
+        self._data = data
+        self._heating_spline = None
+        self._data_modified = True
+        self._raw_data = None  # no longer needed for recalculation
+
+    def data_changed(self) -> None:
+        """Record that the data arrays have been modified in place.
+
+        This discards any spline previously fitted to the data.
+        """
+        self._heating_spline = None
+        self._data_modified = True
+        self._raw_data = None  # no longer needed for recalculation
 
     def write_csv(self, filename: str) -> None:
         """Write furnace-corrected data to a CSV file.
@@ -201,17 +314,20 @@ class MeasurementCycle:
         :param filename: name of file to write to.
         """
 
-        cooling = (list(reversed(self.data[1][0])),
-                   list(reversed(self.data[1][1])))
+        # Heating data, followed by cooling data in reverse order. The
+        # output is built as one string and written in a single call;
+        # converting to lists first makes the formatting work on Python
+        # floats rather than NumPy scalars, which is considerably faster.
+        temps = numpy.concatenate((self.data.heat.temps,
+                                   self.data.cool.temps[::-1])).tolist()
+        mss = numpy.concatenate((self.data.heat.mss,
+                                 self.data.cool.mss[::-1])).tolist()
         with open(filename, "w") as fh:
-            for direction in self.data[0], cooling:
-                pairs = zip(direction[0], direction[1])
-                for pair in pairs:
-                    fh.write("%.2f,%.2f\n" % (pair[0], pair[1]))
+            fh.write("".join(["%.2f,%.2f\n" % pair
+                              for pair in zip(temps, mss)]))
 
     @staticmethod
-    def chop_data(temps_mss: Tuple[ndarray, ndarray], min_temp: float,
-                  max_temp: float) -> Tuple[ndarray, ndarray]:
+    def chop_data(sweep: Sweep, min_temp: float, max_temp: float) -> Sweep:
         """Truncate data to a given temperature range.
 
         Any temperature falling outside the specified range will be excluded
@@ -219,21 +335,15 @@ class MeasurementCycle:
         susceptibility value will be excluded from the returned susceptibility
         array.
 
-        :param temps_mss: a 2-tuple of lists, (temperatures, susceptibilites)
+        :param sweep: the temperatures and susceptibilities to truncate
         :param min_temp: minimum temperature for truncation
         :param max_temp: maximum remperature for truncation
-        :return: a 2-tuple of ndarrays, (temperatures, susceptibilities), where
-                 all temperatures are in the range (min_temp, max_temp)
+        :return: a Sweep in which all temperatures are in the range
+                 (min_temp, max_temp)
         """
-        temps, mss = temps_mss
-        temps_out = []
-        mss_out = []
-        for i in range(0, len(temps)):
-            temp = temps[i]
-            if min_temp <= temp <= max_temp:
-                temps_out.append(temp)
-                mss_out.append(mss[i])
-        return array(temps_out), array(mss_out)
+        temps, mss = map(numpy.asarray, sweep)
+        mask = (temps >= min_temp) & (temps <= max_temp)
+        return Sweep(temps[mask], mss[mask])
 
     @staticmethod
     def linear_fit(xs: ndarray, ys: ndarray) -> Tuple[numpy.poly1d, float]:
@@ -246,12 +356,20 @@ class MeasurementCycle:
         :param ys: y co-ordinates
         :return: a tuple of (numpy.poly1d, r_squared)
         """
-        fit = numpy.polyfit(xs, ys, 1)
-        poly = numpy.poly1d(fit.tolist())
-        model_ys = poly(xs)
-        mean_y = numpy.mean(ys)
+        # For a straight line the least-squares fit has a closed form, which
+        # is much cheaper than the general solver used by numpy.polyfit.
+        xs = numpy.asarray(xs, dtype=float)
+        ys = numpy.asarray(ys, dtype=float)
+        mean_x = xs.mean()
+        mean_y = ys.mean()
+        dxs = xs - mean_x
+        dys = ys - mean_y
+        slope = (dxs * dys).sum() / (dxs * dxs).sum()
+        intercept = mean_y - slope * mean_x
+        poly = numpy.poly1d([slope, intercept])
+        model_ys = slope * xs + intercept
         sserr = numpy.sum((ys - model_ys) ** 2)
-        sstot = numpy.sum((ys - mean_y) ** 2)
+        sstot = numpy.sum(dys ** 2)
         rsquared = 1 - sserr / sstot
         # rsquared is already a float; the "conversion" is to help type checkers
         return poly, float(rsquared)
@@ -268,9 +386,10 @@ class MeasurementCycle:
           poly is polynomial object representing line of best fit.
         """
 
-        temps, mss = \
-            MeasurementCycle.chop_data(self.data[0], min_temp, max_temp)
-        poly, rsquared = MeasurementCycle.linear_fit(temps, 1. / mss)
+        chopped = \
+            MeasurementCycle.chop_data(self.data.heat, min_temp, max_temp)
+        poly, rsquared = \
+            MeasurementCycle.linear_fit(chopped.temps, 1. / chopped.mss)
         curie = poly.r[0]  # x axis intercept
         return curie, rsquared, poly
 
@@ -292,14 +411,20 @@ class MeasurementCycle:
 
         # Fit a cubic spline to the data. Using the whole dataset gives
         # a better approximation at the endpoints of the selected range.
-        spline = UnivariateSpline(self.data[0][0], self.data[0][1], s=.1)
+        # The fit doesn't depend on the selected range, so it is kept for
+        # subsequent calls.
+        if self._heating_spline is None:
+            self._heating_spline = UnivariateSpline(
+                self.data.heat.temps, self.data.heat.mss, s=.1)
+        spline = self._heating_spline
 
         # Get the data points which lie within the selected range.
-        temps, _ = MeasurementCycle.chop_data(self.data[0], min_temp, max_temp)
+        temps = MeasurementCycle.chop_data(self.data.heat,
+                                           min_temp, max_temp).temps
 
         # Evaluate the second derivative of the spline at each selected
         # temperature step.
-        derivs = [spline.derivatives(t)[2] for t in temps]
+        derivs = spline.derivative(n=2)(temps)
 
         # Fit a new spline to the derivatives in order to calculate the
         # inflection point.
@@ -313,20 +438,21 @@ class MeasurementCycle:
 
         :return: the alteration idex for this cycle
         """
-        return self.data[0][1][0] - self.data[1][1][0]
+        return self.data.heat.mss[0] - self.data.cool.mss[0]
 
-    def correct_for_volume(self, data: ndarray) -> ndarray:
+    def correct_for_volume(self, sweep: Sweep) -> Sweep:
         """Correct supplied data for volume.
 
         The volume correction factor is (nominal_volume / real_volume). The
         values are set by the constructor.
 
-        :param data: a list of numerical data to correct
-        :return: a list containing the supplied data scaled by the
-                 volume correction factor
+        :param sweep: the measurements to correct
+        :return: a Sweep with the same temperatures and with the
+                 susceptibilities scaled by the volume correction factor
         """
+        temps, mss = sweep
         scale = self.nom_vol / self.real_vol
-        return array([scale * datum for datum in data])
+        return Sweep(temps, scale * numpy.asarray(mss))
 
     @staticmethod
     def shunt_up(values: List[float]) -> List[float]:
@@ -351,32 +477,26 @@ class MeasurementSet:
     """The results of a series of heating-cooling cycles on a single sample."""
 
     @staticmethod
-    def shunt(heat_cool: Tuple[Tuple[List[float], List[float]],
-                               Tuple[List[float], List[float]]], offset: float)\
-            -> Tuple[Tuple[List[float], List[float]],
-                     Tuple[List[float], List[float]]]:
+    def shunt(cycle: Cycle, offset: float) -> Cycle:
         """Offset all magnetic susceptibility values by a supplied value.
 
-        :param heat_cool: ((heating_temps, heating_susceptibilities),
-                           (cooling_temps, cooling_susceptibilities))
+        :param cycle: heating and cooling measurements
         :param offset: amount to add to or subtract from each susceptibility
-        :return: a tuple of tuples like heat_cool, but with susceptibilies
+        :return: a Cycle like the supplied one, but with susceptibilies
                  offset
         """
-        heat, cool = heat_cool
-        heat_s = (heat[0], [m + offset for m in heat[1]])
-        cool_s = (cool[0], [m + offset for m in cool[1]])
-        return heat_s, cool_s
+        (heat_temps, heat_mss), (cool_temps, cool_mss) = cycle
+        return Cycle(Sweep(heat_temps, numpy.asarray(heat_mss) + offset),
+                     Sweep(cool_temps, numpy.asarray(cool_mss) + offset))
 
     def make_zero_at_700(self) -> None:
         """Correct values for a zero susceptibility at/near 700 degrees"""
 
-        print(self.name, self.cycles.keys(), self.cycles[700][0][1][:5])
-        offset = -min(self.cycles[700][0][1][-5:])
-        new_data = {}
-        for temp in self.cycles.keys():
-            new_data[temp] = MeasurementSet.shunt(self.cycles[temp], offset)
-        self.cycles = new_data
+        print(self.name, self.cycles.keys(),
+              self.cycles[700].data.heat.mss[:5])
+        offset = -min(self.cycles[700].data.heat.mss[-5:])
+        for cycle in self.cycles.values():
+            cycle.data = MeasurementSet.shunt(cycle.data, offset)
 
     @staticmethod
     def filename_to_temp(filename: str) -> Optional[int]:
@@ -402,12 +522,10 @@ class MeasurementSet:
         :param new_oom: the new order of magnitude
         """
         scale = 10. ** (self.oom - new_oom)
-        new_data = {}
-        for (temp, (heating, cooling)) in self.cycles.items():
-            heating2 = (heating[0], [ms*scale for ms in heating[1]])
-            cooling2 = (cooling[0], [ms*scale for ms in cooling[1]])
-            new_data[temp] = (heating2, cooling2)
-        self.cycles = new_data
+        for cycle in self.cycles.values():
+            cycle.data.heat.mss *= scale
+            cycle.data.cool.mss *= scale
+            cycle.data_changed()
         self.oom = new_oom
 
     def read_files(self, sample_dir: str) -> None:
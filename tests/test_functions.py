@@ -3,6 +3,8 @@
 from tdmagsus import read_cur_file
 import os.path
 import hashlib
+import tempfile
+import numpy
 
 import unittest
 
@@ -13,8 +15,7 @@ class TestFunctions(unittest.TestCase):
     def test_read_cur_file(self):
         filename = os.path.join(os.path.dirname(__file__), "testdata",
                                 "TUBE1.CUR")
-        (heating_t, heating_ms), (cooling_t, cooling_ms) = \
-            read_cur_file(filename)
+        data = read_cur_file(filename)
 
         def check_hash(expected, array):
             # We use hashlib here, because since Python 3.3 object.__hash__
@@ -28,10 +29,37 @@ class TestFunctions(unittest.TestCase):
         # more concise and convenient than using full arrays for the expected
         # values.
         check_hash("1ac194f68a365c9b7524d7f9146487a685a7fd4a999764ddec174147",
-                   heating_t)
+                   data.heat.temps)
         check_hash("ac19cce10c9380be6ccc761746488a5d189ec2d41cfeb6df6d755abf",
-                   heating_ms)
+                   data.heat.mss)
         check_hash("07d78fda1292e48c63f58ecb46a7c7e98c01189090ee7fc27bf995ce",
-                   cooling_t)
+                   data.cool.temps)
         check_hash("999d9229f8ecaae3d56b5a3b9d490bb8328ea50f12260928de5ab6fd",
-                   cooling_ms)
+                   data.cool.mss)
+
+    def test_read_cur_file_unpacks_as_tuple(self):
+        filename = os.path.join(os.path.dirname(__file__), "testdata",
+                                "TUBE1.CUR")
+        data = read_cur_file(filename)
+        (heat_temps, heat_mss), (cool_temps, cool_mss) = data
+        self.assertIs(data.heat.temps, heat_temps)
+        self.assertIs(data.heat.mss, heat_mss)
+        self.assertIs(data.cool.temps, cool_temps)
+        self.assertIs(data.cool.mss, cool_mss)
+        self.assertIs(data.heat, data[0])
+        self.assertIs(data.cool.mss, data[1][1])
+
+    def test_read_cur_file_skips_unindented_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "1.CUR")
+            with open(filename, "w") as fh:
+                fh.write("2019-03-01 sample 1\n"
+                         "  TEMP    TSUSC\n"
+                         "  20.0   10.0\n"
+                         "  30.0   11.0\n"
+                         "  40.0   12.0\n"
+                         "  30.0   13.0\n"
+                         "  20.0   14.0\n")
+            data = read_cur_file(filename)
+        self.assertTrue(numpy.array_equal([30, 40], data.heat.temps))
+        self.assertTrue(numpy.array_equal([30, 40], data.cool.temps))
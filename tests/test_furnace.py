@@ -1,8 +1,11 @@
 #!/usr/bin/python3
 
-from tdmagsus import Furnace
-from numpy import array, array_equal
+from tdmagsus import Furnace, Cycle, Sweep
+from numpy import allclose, arange, array, array_equal, ndarray
+from scipy.interpolate import UnivariateSpline
 
+import os.path
+import tempfile
 import unittest
 
 
@@ -18,9 +21,9 @@ class TestFurnace(unittest.TestCase):
                                     mss_result))
 
     def test_correct_with_spline(self):
-        def spline(temperature: float) -> float:
+        def spline(temperatures: ndarray) -> ndarray:
             spline_dict = {30.: 5, 40.: 4, 50.: 3, 60.: 2}
-            return spline_dict[temperature]
+            return array([spline_dict[t] for t in temperatures])
 
         temps = [30., 40., 50., 60.]
         mss = [21, 22, 23, 24]
@@ -30,3 +33,26 @@ class TestFurnace(unittest.TestCase):
 
         self.assertListEqual(temps, temps_result)
         self.assertTrue(array_equal(array([16, 18, 20, 22]), mss_result))
+
+    def test_correct_follows_replaced_spline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "FURNACE.CUR")
+            with open(filename, "w") as fh:
+                fh.write("  TEMP    TSUSC\n")
+                for temp in list(range(25, 701, 5)) + \
+                        list(range(695, 24, -5)):
+                    fh.write(" %5.1f %8.1f\n" % (temp, -150 + temp / 100))
+            furnace = Furnace(filename)
+        temps = array([100., 250., 400.])
+        mss = array([1., 2., 3.])
+        cycle = Cycle(Sweep(temps, mss), Sweep(temps, mss))
+        corrected = furnace.correct(cycle)
+        self.assertTrue(allclose(mss - furnace.heat_spline(temps),
+                                 corrected.heat.mss))
+        spline_temps = arange(0., 800., 10.)
+        furnace.heat_spline = UnivariateSpline(spline_temps,
+                                               spline_temps / 10, s=1)
+        corrected = furnace.correct(cycle)
+        self.assertTrue(allclose(mss - temps / 10, corrected.heat.mss))
+        self.assertTrue(allclose(mss - furnace.cool_spline(temps),
+                                 corrected.cool.mss))
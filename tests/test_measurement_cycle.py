@@ -1,23 +1,87 @@
 #!/usr/bin/python3
 
-from tdmagsus import MeasurementCycle
-from numpy import array, array_equal
+from tdmagsus import MeasurementCycle, Cycle, Sweep, read_cur_file
+from numpy import allclose, array, array_equal, polyfit, polyval
 
+import os.path
+import tempfile
 import unittest
+from unittest.mock import Mock
 
 
 class TestMeasurementCycle(unittest.TestCase):
     """Tests for the MeasurementCycle class"""
 
+    def test_data_is_volume_corrected_on_demand(self):
+        filename = os.path.join(os.path.dirname(__file__), "testdata",
+                                "TUBE1.CUR")
+        raw = read_cur_file(filename)
+        cycle = MeasurementCycle(None, filename, real_vol=0.5, nom_vol=10.0)
+        self.assertTrue(allclose(raw.heat.mss * 20, cycle.data.heat.mss))
+        self.assertTrue(allclose(raw.cool.mss * 20, cycle.data.cool.mss))
+        cycle.furnace = None  # discards and recalculates the corrected data
+        self.assertTrue(allclose(raw.heat.mss * 20, cycle.data.heat.mss))
+
+    def test_furnace_correction_is_deferred(self):
+        filename = os.path.join(os.path.dirname(__file__), "testdata",
+                                "TUBE1.CUR")
+        raw = read_cur_file(filename)
+        furnace = Mock()
+        furnace.correct.side_effect = lambda cycle: Cycle(
+            Sweep(cycle.heat.temps, cycle.heat.mss - 1),
+            Sweep(cycle.cool.temps, cycle.cool.mss - 1))
+        cycle = MeasurementCycle(furnace, filename, real_vol=0.5,
+                                 nom_vol=10.0)
+        furnace.correct.assert_not_called()
+        self.assertTrue(allclose((raw.heat.mss - 1) * 20,
+                                 cycle.data.heat.mss))
+        self.assertTrue(allclose((raw.cool.mss - 1) * 20,
+                                 cycle.data.cool.mss))
+        furnace.correct.assert_called_once()
+
+    def test_correct_for_volume_uses_current_volumes(self):
+        filename = os.path.join(os.path.dirname(__file__), "testdata",
+                                "TUBE1.CUR")
+        cycle = MeasurementCycle(None, filename, real_vol=0.5, nom_vol=10.0)
+        cycle.real_vol = 2.0
+        corrected = cycle.correct_for_volume(Sweep(array([1., 2.]),
+                                                   array([3., 4.])))
+        self.assertTrue(array_equal(array([15., 20.]), corrected.mss))
+
+    def test_write_csv(self):
+        filename = os.path.join(os.path.dirname(__file__), "testdata",
+                                "TUBE1.CUR")
+        cycle = MeasurementCycle(None, filename)
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "out.csv")
+            cycle.write_csv(output)
+            with open(output) as fh:
+                lines = fh.read().splitlines()
+        heat, cool = cycle.data.heat, cycle.data.cool
+        self.assertEqual(len(heat.temps) + len(cool.temps), len(lines))
+        self.assertEqual("%.2f,%.2f" % (heat.temps[0], heat.mss[0]), lines[0])
+        self.assertEqual("%.2f,%.2f" % (cool.temps[0], cool.mss[0]), lines[-1])
+
     def test_chop_data(self):
         input_temps = array([0, 20, 40, 60, 80, 70, 50, 30, 10])
         expected_temps = array([40, 60, 50, 30])
         input_suscs = array([3, 1, 4, 1, 5, 9, 2, 6, 5])
         expected_suscs = array([4, 1, 2, 6])
-        output_temps, output_suscs = \
-            MeasurementCycle.chop_data((input_temps, input_suscs), 25, 65)
-        self.assertTrue(array_equal(expected_temps, output_temps))
-        self.assertTrue(array_equal(expected_suscs, output_suscs))
+        output = MeasurementCycle.chop_data(Sweep(input_temps, input_suscs),
+                                            25, 65)
+        self.assertTrue(array_equal(expected_temps, output.temps))
+        self.assertTrue(array_equal(expected_suscs, output.mss))
+
+    def test_linear_fit(self):
+        xs = array([1., 2., 3., 4., 5.])
+        ys = array([2.1, 3.9, 6.2, 7.8, 10.1])
+        poly, rsquared = MeasurementCycle.linear_fit(xs, ys)
+        expected = polyfit(xs, ys, 1)
+        self.assertTrue(allclose(expected, poly.coeffs))
+        model = polyval(expected, xs)
+        expected_rsquared = 1 - ((ys - model) ** 2).sum() / \
+            ((ys - ys.mean()) ** 2).sum()
+        self.assertAlmostEqual(expected_rsquared, rsquared)
 
     def test_shunt_up(self):
         self.assertEqual([0.5, 0, 1.5],
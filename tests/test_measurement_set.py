@@ -1,22 +1,55 @@
 #!/usr/bin/python3
 
-from tdmagsus import MeasurementSet
+from tdmagsus import MeasurementSet, Cycle, Sweep
+from numpy import allclose, array, array_equal
 
+import os.path
+import shutil
+import tempfile
 import unittest
 
 
 class TestMeasurementSet(unittest.TestCase):
 
     def test_shunt(self):
-        (heat_t, heat_ms), (cool_t, cool_ms) = \
-            MeasurementSet.shunt(
-                (([1, 2, 3, 4], [10, 20, 30, 40]),
-                 ([4, 3, 2, 1], [45, 35, 25, 15])),
-                2)
-        self.assertListEqual([1, 2, 3, 4], heat_t)
-        self.assertListEqual([4, 3, 2, 1], cool_t)
-        self.assertListEqual([12, 22, 32, 42], heat_ms)
-        self.assertListEqual([47, 37, 27, 17], cool_ms)
+        shunted = MeasurementSet.shunt(
+            Cycle(Sweep(array([1, 2, 3, 4]), array([10, 20, 30, 40])),
+                  Sweep(array([4, 3, 2, 1]), array([45, 35, 25, 15]))),
+            2)
+        self.assertTrue(array_equal(array([1, 2, 3, 4]), shunted.heat.temps))
+        self.assertTrue(array_equal(array([4, 3, 2, 1]), shunted.cool.temps))
+        self.assertTrue(array_equal(array([12, 22, 32, 42]), shunted.heat.mss))
+        self.assertTrue(array_equal(array([47, 37, 27, 17]), shunted.cool.mss))
+
+    def test_set_oom(self):
+        source = os.path.join(os.path.dirname(__file__), "testdata",
+                              "TUBE1.CUR")
+        with tempfile.TemporaryDirectory() as sample_dir:
+            for name in "300.CUR", "700.CUR":
+                shutil.copy(source, os.path.join(sample_dir, name))
+            mset = MeasurementSet(None, sample_dir)
+        expected = {temp: (cycle.data.heat.mss * 100,
+                           cycle.data.cool.mss * 100)
+                    for temp, cycle in mset.cycles.items()}
+        mset.set_oom(-7)
+        mset.set_oom(-8)
+        self.assertEqual(-8, mset.oom)
+        for temp, cycle in mset.cycles.items():
+            self.assertTrue(allclose(expected[temp][0], cycle.data.heat.mss))
+            self.assertTrue(allclose(expected[temp][1], cycle.data.cool.mss))
+
+    def test_furnace_cannot_be_changed_after_set_oom(self):
+        source = os.path.join(os.path.dirname(__file__), "testdata",
+                              "TUBE1.CUR")
+        with tempfile.TemporaryDirectory() as sample_dir:
+            shutil.copy(source, os.path.join(sample_dir, "700.CUR"))
+            mset = MeasurementSet(None, sample_dir)
+        cycle = mset.cycles[700]
+        expected = cycle.data.heat.mss * 10
+        mset.set_oom(-7)
+        with self.assertRaises(ValueError):
+            cycle.furnace = None
+        self.assertTrue(allclose(expected, cycle.data.heat.mss))
 
     def test_filename_to_temp(self):
         self.assertIsNone(MeasurementSet.filename_to_temp("unparseable"))